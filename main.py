@@ -8,6 +8,7 @@ insights into market trends and skill demands.
 
 import argparse
 import json
+import logging
 import os
 import sys
 from pathlib import Path
@@ -814,4 +815,10 @@ if __name__ == "__main__":
         logger.info("⚠️  Operation cancelled by user (Ctrl-C)")
         logger.info("=" * 80)
         logger.info("")
-        sys.exit(1)
+        # Classification batches may still be waiting for LLM responses on worker
+        # threads. sys.exit() would join them (up to the request timeout each), so
+        # flush the logs and leave right away.
+        logging.shutdown()
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(1)
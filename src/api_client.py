@@ -3,6 +3,7 @@ API client for the German Arbeitsagentur job search API
 https://github.com/bundesAPI/jobsuche-api
 """
 
+from collections.abc import Iterator
 from typing import TYPE_CHECKING, Optional
 
 import requests
@@ -51,6 +52,51 @@ def search_jobs(
     Returns:
         List of all job listings
     """
+    return list(
+        search_jobs_iter(
+            was=was,
+            wo=wo,
+            size=size,
+            max_pages=max_pages,
+            umkreis=umkreis,
+            arbeitszeit=arbeitszeit,
+            zeitarbeit=zeitarbeit,
+            veroeffentlichtseit=veroeffentlichtseit,
+            exclude_weiterbildung=exclude_weiterbildung,
+            session=session,
+            http_client=http_client,
+            config_obj=config_obj,
+        )
+    )
+
+
+def search_jobs_iter(
+    was: str,
+    wo: str | None = None,
+    size: int | None = None,
+    max_pages: int | None = None,
+    umkreis: int | None = None,
+    arbeitszeit: str = "",
+    zeitarbeit: bool = False,
+    veroeffentlichtseit: int | None = None,
+    exclude_weiterbildung: bool = True,
+    session: Optional["SearchSession"] = None,
+    http_client: HttpClient | None = None,
+    config_obj: Config | None = None,
+) -> Iterator[dict]:
+    """
+    Search for jobs on Arbeitsagentur, yielding jobs page by page
+
+    Streaming variant of search_jobs(): filtered jobs are yielded as soon as
+    their page has been fetched, so callers can start processing before all
+    pages are downloaded. Takes the same arguments as search_jobs().
+
+    Note: Raw API responses are saved to the session only once the iterator
+    has been exhausted.
+
+    Yields:
+        Job listings (filtered like search_jobs())
+    """
     if http_client is None:
         http_client = default_http_client
     if config_obj is None:
@@ -73,7 +119,7 @@ def search_jobs(
         "Connection": "keep-alive",
     }
 
-    all_jobs = []
+    total_jobs = 0
     raw_responses = []  # Collect raw responses for debugging
 
     for page in range(1, max_pages + 1):
@@ -110,47 +156,45 @@ def search_jobs(
                 timeout=config_obj.get("api.timeouts.api_request", 30),
             )
 
-            if response.status_code == 200:
-                data = response.json()
-
-                # Save raw response for debugging
-                raw_responses.append({"page": page, "response": data})
-
-                jobs = data.get("stellenangebote", [])
-
-                if not jobs:
-                    break  # No more results
-
-                # Filter out Weiterbildung/Ausbildung jobs if requested
-                if exclude_weiterbildung:
-                    exclude_keywords = config_obj.get(
-                        "search.filters.exclude_keywords", ["weiterbildung", "ausbildung"]
-                    )
-                    jobs = [
-                        job
-                        for job in jobs
-                        if not any(
-                            keyword in job.get("beruf", "").lower() for keyword in exclude_keywords
-                        )
-                    ]
-
-                all_jobs.extend(jobs)
-
-                # Check if we've fetched all available results
-                total_results = int(data.get("maxErgebnisse", "0"))
-                if len(all_jobs) >= total_results:
-                    break
-
-            else:
+            if response.status_code != 200:
                 logger.error(f"API request failed on page {page}: HTTP {response.status_code}")
                 logger.error(
-                    f"Returning partial results: {len(all_jobs)} jobs from {page - 1} page(s)"
+                    f"Returning partial results: {total_jobs} jobs from {page - 1} page(s)"
                 )
                 break
 
+            data = response.json()
+
         except requests.exceptions.RequestException as e:
             logger.error(f"Network error fetching page {page}: {e}")
-            logger.error(f"Returning partial results: {len(all_jobs)} jobs from {page - 1} page(s)")
+            logger.error(f"Returning partial results: {total_jobs} jobs from {page - 1} page(s)")
+            break
+
+        # Save raw response for debugging
+        raw_responses.append({"page": page, "response": data})
+
+        jobs = data.get("stellenangebote", [])
+
+        if not jobs:
+            break  # No more results
+
+        # Filter out Weiterbildung/Ausbildung jobs if requested
+        if exclude_weiterbildung:
+            exclude_keywords = config_obj.get(
+                "search.filters.exclude_keywords", ["weiterbildung", "ausbildung"]
+            )
+            jobs = [
+                job
+                for job in jobs
+                if not any(keyword in job.get("beruf", "").lower() for keyword in exclude_keywords)
+            ]
+
+        total_jobs += len(jobs)
+        yield from jobs
+
+        # Check if we've fetched all available results
+        total_results = int(data.get("maxErgebnisse", "0"))
+        if total_jobs >= total_results:
             break
 
     # Save raw API responses if session is provided
@@ -169,12 +213,10 @@ def search_jobs(
                     "exclude_weiterbildung": exclude_weiterbildung,
                 },
                 "pages": raw_responses,
-                "total_jobs_found": len(all_jobs),
+                "total_jobs_found": total_jobs,
             }
         )
 
-    return all_jobs
-
 
 def simplify_job_data(jobs: list[dict]) -> list[dict]:
     """
@@ -4,7 +4,9 @@ Automatically categorizes job listings into predefined categories
 """
 
 import os
-import re
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Optional
 
 from .config import Config, config
@@ -18,9 +20,113 @@ from .logging_config import get_module_logger
 logger = get_module_logger("classifier")
 
 if TYPE_CHECKING:
+    from .llm.openrouter_client import OpenRouterClient
+    from .llm.result_cache import ClassificationCache
     from .session import SearchSession
 
 
+# Prompt for one batch request. Part of the classification cache key, so editing it
+# re-classifies jobs instead of serving results produced with the old wording.
+BATCH_PROMPT_TEMPLATE = """Classify these {num_jobs} German job descriptions into categories.
+
+OUTPUT FORMAT (CRITICAL - Read this first!):
+Return ONE LINE per job in this EXACT format:
+[001] - Excellent Match
+[002] - Good Match
+[003] - {fallback_category}
+
+Use ONLY these categories: {categories_str}
+Each job must be assigned to exactly ONE category.
+If none of the specific categories apply, use "{fallback_category}".
+{guidance}
+
+EVALUATION CHECKLIST (Apply to each job):
+✓ Do core requirements match the candidate's PRIMARY specialization?
+✓ Are required technologies CENTRAL to candidate's expertise (not just mentioned)?
+✓ Does the seniority level align?
+✓ Does the domain/industry match the background?
+✓ When in doubt between Good Match and Poor Match, choose Poor Match
+
+============================================================
+JOB LISTINGS TO CLASSIFY
+============================================================
+{jobs_text}
+============================================================
+END OF JOB LISTINGS
+============================================================
+
+REMEMBER: Return format - [001] - Category Name
+IMPORTANT: Be STRICT. Most jobs should be "{fallback_category}".
+Return ONLY the lines with job IDs and categories, nothing else.
+"""
+
+
+@dataclass(frozen=True)
+class _BatchSettings:
+    """Prompt pieces and request settings shared by every batch of one classification run"""
+
+    categories: list[str]
+    categories_str: str  # Pre-joined, quoted category list for the prompt
+    guidance: str  # Pre-built category guidance (see build_category_guidance)
+    fallback_category: str  # Category to use when none of the specific ones apply
+    max_chars_mega: int  # Maximum job text length; longer texts raise TruncationError
+    temperature: float
+    timeout: int
+    model: str
+    extra_api_params: dict | None
+    client: "OpenRouterClient"  # One client (endpoint, auth headers) for all batches
+    config_obj: Config
+    copy_inputs: bool
+
+
+def _parse_job_line(line: str) -> tuple[str, str] | None:
+    """
+    Parse one result line of a batch response: [001] - Category
+
+    The format is fixed, so plain string checks replace a regex match per line.
+
+    Args:
+        line: Stripped response line
+
+    Returns:
+        (simple_id, categories string) or None if the line is not a result line
+    """
+    if len(line) < 7 or line[0] != "[" or line[4] != "]":
+        return None
+
+    simple_id = line[1:4]
+    if not simple_id.isdecimal():
+        return None
+
+    # Accept dash (-) as separator, with optional whitespace around it
+    rest = line[5:].lstrip()
+    if not rest.startswith("-") or len(rest) < 2:
+        return None
+
+    return simple_id, rest[1:].strip()
+
+
+def _iter_result_lines(content: str) -> Iterator[tuple[str, str]]:
+    """
+    Yield the parsed result lines of a batch response, skipping everything else
+
+    Args:
+        content: Response text from the LLM
+
+    Yields:
+        (simple_id, categories string) for every line in [001] - Category format
+    """
+    for line in content.splitlines():
+        line = line.strip()
+        # Skip blank lines and commentary (result lines start with '[')
+        if not line.startswith("["):
+            continue
+
+        parsed = _parse_job_line(line)
+        if parsed:
+            yield parsed
+
+
 def get_fallback_category(categories: list[str]) -> str:
     """
     Determine the appropriate fallback category based on the categories list.
@@ -84,12 +190,15 @@ def classify_jobs_batch(
     category_definitions: dict[str, str] | None = None,
     http_client: HttpClient | None = None,
     config_obj: Config | None = None,
+    copy_inputs: bool = True,
+    result_cache: Optional["ClassificationCache"] = None,
 ) -> list[dict]:
     """
     Classify jobs in batches with automatic splitting for large job sets
 
     Processes jobs in batches, automatically splitting into multiple API calls
-    if needed. Supports checkpointing and resume for reliability.
+    if needed. Batch requests run concurrently (processing.limits.batch_max_workers)
+    while results are collected in order. Supports checkpointing and resume for reliability.
 
     Args:
         jobs: List of jobs with 'text' field
@@ -101,8 +210,15 @@ def classify_jobs_batch(
         extra_api_params: Additional parameters for the API request (e.g., {"reasoning": {"effort": "high"}})
         session: SearchSession to save LLM requests/responses
         category_definitions: Optional dict of category -> description mappings
-        http_client: HTTP client for making requests (optional)
+        http_client: HTTP client for making requests (optional, defaults to the shared
+                     pooled client - reuse one instance rather than creating one per call)
         config_obj: Config object (optional, uses global config if None)
+        copy_inputs: If True (default), return new job dicts and leave the input jobs
+                     untouched. If False, add 'categories' to the input dicts in place
+                     (avoids a copy per job when the caller owns the list).
+        result_cache: Optional persistent cache of earlier results. Jobs with a cached
+                      result for the same model/categories/guidance/text are not sent
+                      to the LLM again.
 
     Returns:
         List of jobs with added 'categories' field
@@ -126,58 +242,222 @@ def classify_jobs_batch(
     else:
         max_jobs_per_batch = batch_size
 
+    # Import locally to avoid circular dependency
+    from .llm.openrouter_client import OpenRouterClient
+
+    # Prompt pieces and request settings shared by every batch - resolve them once per run
+    guidance = build_category_guidance(categories, category_definitions)
+    settings = _BatchSettings(
+        categories=categories,
+        categories_str=", ".join(f'"{cat}"' for cat in categories),
+        guidance=guidance,
+        fallback_category=get_fallback_category(categories),
+        max_chars_mega=config_obj.get_required("processing.limits.job_text_mega_batch"),
+        temperature=config_obj.get_required("llm.inference.temperature"),
+        timeout=config_obj.get("api.timeouts.mega_batch_classification", 120),
+        model=model,
+        extra_api_params=extra_api_params,
+        client=OpenRouterClient(api_key=api_key, http_client=http_client, config_obj=config_obj),
+        config_obj=config_obj,
+        copy_inputs=copy_inputs,
+    )
+
+    if result_cache is not None:
+        # Serve previously classified jobs from the cache, send only the misses
+        context_key = result_cache.context_key(
+            model,
+            categories,
+            guidance,
+            extra_api_params,
+            temperature=settings.temperature,
+            prompt_template=BATCH_PROMPT_TEMPLATE,
+        )
+        cache_keys = [result_cache.job_key(context_key, job.get("text", "")) for job in jobs]
+        cached = result_cache.get_many(cache_keys)
+    else:
+        # No persistent cache - key on the text itself to catch duplicates within this call
+        cache_keys = [job.get("text", "") for job in jobs]
+        cached = {}
+
+    if result_cache is not None or len(set(cache_keys)) < len(cache_keys):
+        # Identical texts (same posting under several refnrs) are sent only once
+        misses: dict[str, dict] = {}
+        for job, key in zip(jobs, cache_keys, strict=True):
+            if key not in cached and key not in misses:
+                misses[key] = job
+
+        num_uncached = sum(1 for key in cache_keys if key not in cached)
+        if cached:
+            logger.info(
+                f"✓ {len(jobs) - num_uncached}/{len(jobs)} jobs served from classification cache"
+            )
+        if num_uncached > len(misses):
+            logger.info(f"✓ {num_uncached - len(misses)} duplicate job texts classified only once")
+
+        newly_classified = (
+            _classify_in_batches(
+                list(misses.values()),
+                settings,
+                max_jobs_per_batch,
+                session,
+                result_cache=result_cache,
+                cache_keys=list(misses),
+            )
+            if misses
+            else []
+        )
+        classified_by_key = dict(zip(misses, newly_classified, strict=True))
+        new_results = {key: job["categories"] for key, job in classified_by_key.items()}
+
+        # Reassemble in input order
+        classified_jobs = []
+        for job, key in zip(jobs, cache_keys, strict=True):
+            if key in misses and misses[key] is job:
+                classified_jobs.append(classified_by_key[key])
+                continue
+
+            job_cats = cached[key] if key in cached else new_results[key]
+            if copy_inputs:
+                job = {**job, "categories": job_cats}
+            else:
+                job["categories"] = job_cats
+            classified_jobs.append(job)
+
+        return classified_jobs
+
+    return _classify_in_batches(jobs, settings, max_jobs_per_batch, session)
+
+
+def _classify_in_batches(
+    jobs: list[dict],
+    settings: _BatchSettings,
+    max_jobs_per_batch: int,
+    session: Optional["SearchSession"],
+    result_cache: Optional["ClassificationCache"] = None,
+    cache_keys: list[str] | None = None,
+) -> list[dict]:
+    """
+    Classify jobs with one LLM request per batch of at most max_jobs_per_batch jobs
+
+    Args:
+        jobs: Jobs to classify
+        settings: Shared prompt pieces and request settings
+        max_jobs_per_batch: Maximum number of jobs per request
+        session: SearchSession for saving LLM interactions and checkpoints
+        result_cache: Optional persistent cache - each batch's results are stored as
+                      soon as the batch succeeds, so a later failure doesn't lose them
+        cache_keys: Cache keys aligned with jobs (required with result_cache)
+
+    Returns:
+        List of jobs with added 'categories' field, in input order
+    """
     if len(jobs) > max_jobs_per_batch:
         # Split into multiple batches
         num_batches = (len(jobs) + max_jobs_per_batch - 1) // max_jobs_per_batch
 
+        # Spread jobs evenly (e.g. 71 jobs -> 36 + 35 rather than 70 + 1) - batches run
+        # concurrently, so the run takes as long as its largest batch
+        base_size, remainder = divmod(len(jobs), num_batches)
+        batch_bounds = []
+        start = 0
+        for n in range(num_batches):
+            end = start + base_size + (1 if n < remainder else 0)
+            batch_bounds.append((start, end))
+            start = end
+
         logger.info(f"Splitting {len(jobs)} jobs into {num_batches} batches...")
-        logger.info(f"  (~{max_jobs_per_batch} jobs per batch for safe context usage)")
+        logger.info(
+            f"  (~{base_size + (1 if remainder else 0)} jobs per batch, max {max_jobs_per_batch} "
+            f"for safe context usage)"
+        )
 
+        # Batch requests are independent network calls - run several concurrently,
+        # but collect results in submission order so output and checkpoints stay
+        # deterministic
+        max_workers = min(
+            num_batches, settings.config_obj.get("processing.limits.batch_max_workers", 4)
+        )
         classified_jobs = []
-        for i in range(0, len(jobs), max_jobs_per_batch):
-            batch = jobs[i : i + max_jobs_per_batch]
-            batch_num = (i // max_jobs_per_batch) + 1
-
-            logger.info(f"{'=' * 60}")
-            logger.info(f"Batch {batch_num}/{num_batches}: {len(batch)} jobs")
-            logger.info(f"{'=' * 60}")
-
-            # Recursively call for each sub-batch (will not recurse again since batch <= max)
-            batch_classified = classify_jobs_batch(
-                jobs=batch,
-                categories=categories,
-                api_key=api_key,
-                model=model,
-                batch_size=max_jobs_per_batch,
-                verbose=verbose,
-                extra_api_params=extra_api_params,
-                session=session,
-                category_definitions=category_definitions,
-                http_client=http_client,
-                config_obj=config_obj,
+        # Checkpoints list ALL completed jobs (previous runs + current run) - read the
+        # earlier ones once and extend the list per batch instead of re-reading the file
+        completed_refnrs = (
+            [job.get("refnr", "") for job in session.load_partial_results()] if session else []
+        )
+        # Batches whose results are not checkpointed yet: batch number -> (start, end)
+        unrecorded = dict(enumerate(batch_bounds, start=1))
+
+        def record_batch(batch_num: int, batch_classified: list[dict]) -> None:
+            """Cache and checkpoint the results of one finished batch"""
+            start, end = unrecorded.pop(batch_num)
+            if result_cache is not None and cache_keys is not None:
+                _cache_results(result_cache, cache_keys[start:end], batch_classified)
+            if not session:
+                return
+
+            session.save_partial_results(batch_classified)
+            completed_refnrs.extend(job.get("refnr", "") for job in batch_classified)
+            pending_refnrs = [
+                job.get("refnr", "")
+                for start, end in unrecorded.values()
+                for job in jobs[start:end]
+            ]
+            session.save_checkpoint(
+                completed_refnrs=completed_refnrs,
+                pending_refnrs=pending_refnrs,
+                current_batch=batch_num,
+                total_batches=num_batches,
             )
-            classified_jobs.extend(batch_classified)
-
-            # Save checkpoint after each successful batch
-            if session:
-                session.save_partial_results(batch_classified)
-
-                # Calculate completed and pending refnrs
-                # IMPORTANT: Include ALL completed jobs (previous runs + current run)
-                all_completed_jobs = session.load_partial_results()
-                completed_refnrs = [job.get("refnr", "") for job in all_completed_jobs]
-                pending_jobs = jobs[(i + max_jobs_per_batch) :]
-                pending_refnrs = [job.get("refnr", "") for job in pending_jobs]
-
-                session.save_checkpoint(
-                    completed_refnrs=completed_refnrs,
-                    pending_refnrs=pending_refnrs,
-                    current_batch=batch_num,
-                    total_batches=num_batches,
-                )
-                logger.info(
-                    f"✓ Checkpoint saved ({len(classified_jobs)}/{len(jobs)} jobs complete)"
+            logger.info(
+                f"✓ Checkpoint saved ({len(jobs) - len(pending_refnrs)}/{len(jobs)} jobs complete)"
+            )
+
+        # Not a with-block: its exit waits for every running request before the error
+        # propagates. Worker threads are still joined at interpreter exit, which is why
+        # main.py leaves with os._exit() on Ctrl-C.
+        executor = ThreadPoolExecutor(max_workers=max(1, max_workers))
+        try:
+            futures = [
+                executor.submit(
+                    _classify_numbered_batch,
+                    jobs[start:end],
+                    batch_num,
+                    num_batches,
+                    settings,
+                    session,
                 )
+                for batch_num, (start, end) in enumerate(batch_bounds, start=1)
+            ]
+
+            try:
+                for batch_num, future in enumerate(futures, start=1):
+                    try:
+                        batch_classified = future.result()
+                    except Exception:
+                        logger.error(f"❌ Batch {batch_num}/{num_batches} failed")
+                        raise
+                    classified_jobs.extend(batch_classified)
+
+                    # Save checkpoint after each successful batch
+                    record_batch(batch_num, batch_classified)
+            except Exception:
+                # Don't send batches still waiting for a worker. Batches already sent
+                # are paid for - checkpoint the ones that succeed so a resume skips them
+                for future in futures:
+                    future.cancel()
+                for batch_num, future in enumerate(futures, start=1):
+                    if (
+                        batch_num in unrecorded
+                        and not future.cancelled()
+                        and future.exception() is None
+                    ):
+                        record_batch(batch_num, future.result())
+                raise
+        except BaseException:
+            # The run is aborting (failed batch or Ctrl-C) - drop batches that haven't
+            # been sent yet and re-raise without waiting for running requests
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        executor.shutdown()
 
         logger.info(f"{'=' * 60}")
         logger.info(f"✓ Completed all {num_batches} batches ({len(classified_jobs)} jobs total)")
@@ -191,160 +471,182 @@ def classify_jobs_batch(
         return classified_jobs
 
     # Single batch (jobs <= max_jobs_per_batch)
-    logger.info(f"Classifying {len(jobs)} jobs in ONE batch request...")
+    classified_jobs = _classify_single_batch(jobs, settings, session)
+    if result_cache is not None and cache_keys is not None:
+        _cache_results(result_cache, cache_keys, classified_jobs)
+    return classified_jobs
 
-    # Determine the appropriate fallback category for this workflow
-    fallback_category = get_fallback_category(categories)
 
-    categories_str = ", ".join(f'"{cat}"' for cat in categories)
-    guidance = build_category_guidance(categories, category_definitions)
+def _cache_results(
+    result_cache: "ClassificationCache", cache_keys: list[str], classified_jobs: list[dict]
+) -> None:
+    """
+    Store the categories of classified jobs in the persistent cache
 
-    max_chars_mega = config_obj.get_required("processing.limits.job_text_mega_batch")
+    Args:
+        result_cache: Cache to write to
+        cache_keys: Cache keys aligned with classified_jobs
+        classified_jobs: Jobs with 'categories' field
+    """
+    result_cache.put_many(
+        {key: job["categories"] for key, job in zip(cache_keys, classified_jobs, strict=True)}
+    )
 
-    # Build ID mapping: simple sequential IDs -> actual refnrs
-    # This makes the prompt cleaner and more reliable for the LLM
-    id_to_refnr = {}
-    for idx, job in enumerate(jobs):
-        simple_id = f"{idx+1:03d}"
-        actual_refnr = job.get("refnr", f"JOB_{idx:03d}")
-        id_to_refnr[simple_id] = actual_refnr
 
-    # Build batch prompt with ALL jobs using simple ID format
-    jobs_text = ""
+def _classify_numbered_batch(
+    jobs: list[dict],
+    batch_num: int,
+    num_batches: int,
+    settings: _BatchSettings,
+    session: Optional["SearchSession"],
+) -> list[dict]:
+    """
+    Classify one batch of a multi-batch run, announcing it when its request starts
+
+    Runs on a worker thread, so the banner shows which batches are actually in
+    flight rather than when they were queued.
+
+    Args:
+        jobs: Jobs of this batch
+        batch_num: 1-based batch number
+        num_batches: Total number of batches in the run
+        settings: Shared prompt pieces and request settings
+        session: SearchSession to save LLM requests/responses
+
+    Returns:
+        List of jobs with added 'categories' field
+    """
+    # One line per banner - workers log concurrently, separator lines would interleave
+    logger.info(f"Batch {batch_num}/{num_batches}: {len(jobs)} jobs")
+    return _classify_single_batch(jobs, settings, session)
+
+
+def _classify_single_batch(
+    jobs: list[dict],
+    settings: _BatchSettings,
+    session: Optional["SearchSession"],
+) -> list[dict]:
+    """
+    Classify a single batch of jobs with ONE LLM request
+
+    Args:
+        jobs: Jobs to classify (at most max_jobs_per_mega_batch)
+        settings: Shared prompt pieces and request settings
+        session: SearchSession to save LLM requests/responses
+
+    Returns:
+        List of jobs with added 'categories' field
+    """
+    logger.info(f"Classifying {len(jobs)} jobs in ONE batch request...")
+
+    # Single pass over the jobs: validate lengths, build the ID mapping and the prompt.
+    # Simple sequential IDs (001, 002, ...) make the prompt cleaner and more reliable
+    # for the LLM; id_to_refnr maps them back to actual refnrs.
+    # (collect fragments and join once - repeated += copies the growing prompt)
+    id_to_refnr = {}
+    job_parts: list[str] = []
 
     for idx, job in enumerate(jobs):
-        simple_id = f"{idx+1:03d}"
-        actual_refnr = job.get("refnr", f"JOB_{idx:03d}")
+        simple_id = f"{idx + 1:03d}"
+        actual_refnr = job.get("refnr")
+        if actual_refnr is None:
+            # Placeholder only formatted for jobs that actually lack a refnr
+            actual_refnr = f"JOB_{idx:03d}"
+        id_to_refnr[simple_id] = actual_refnr
         text = job.get("text", "")
         original_len = len(text)
 
         # Fail on truncation - no silent errors!
-        if original_len > max_chars_mega:
+        if original_len > settings.max_chars_mega:
             logger.error(
-                f"❌ Job [{actual_refnr}] would be truncated: {original_len:,} → {max_chars_mega:,} chars"
+                f"❌ Job [{actual_refnr}] would be truncated: {original_len:,} → {settings.max_chars_mega:,} chars"
             )
             raise TruncationError(
                 job_id=str(actual_refnr),
                 original_length=original_len,
-                truncated_length=max_chars_mega,
+                truncated_length=settings.max_chars_mega,
             )
 
-        jobs_text += f"\n[{simple_id}]\n{text}\n"
-
-    prompt = f"""Classify these {len(jobs)} German job descriptions into categories.
-
-OUTPUT FORMAT (CRITICAL - Read this first!):
-Return ONE LINE per job in this EXACT format:
-[001] - Excellent Match
-[002] - Good Match
-[003] - {fallback_category}
+        job_parts.append(f"\n[{simple_id}]\n")
+        job_parts.append(text)
+        job_parts.append("\n")
 
-Use ONLY these categories: {categories_str}
-Each job must be assigned to exactly ONE category.
-If none of the specific categories apply, use "{fallback_category}".
-{guidance}
+    jobs_text = "".join(job_parts)
 
-EVALUATION CHECKLIST (Apply to each job):
-✓ Do core requirements match the candidate's PRIMARY specialization?
-✓ Are required technologies CENTRAL to candidate's expertise (not just mentioned)?
-✓ Does the seniority level align?
-✓ Does the domain/industry match the background?
-✓ When in doubt between Good Match and Poor Match, choose Poor Match
-
-============================================================
-JOB LISTINGS TO CLASSIFY
-============================================================
-{jobs_text}
-============================================================
-END OF JOB LISTINGS
-============================================================
-
-REMEMBER: Return format - [001] - Category Name
-IMPORTANT: Be STRICT. Most jobs should be "{fallback_category}".
-Return ONLY the lines with job IDs and categories, nothing else.
-"""
+    prompt = BATCH_PROMPT_TEMPLATE.format(
+        num_jobs=len(jobs),
+        categories_str=settings.categories_str,
+        fallback_category=settings.fallback_category,
+        guidance=settings.guidance,
+        jobs_text=jobs_text,
+    )
 
     try:
-        # Import locally to avoid circular dependency
-        from .llm.openrouter_client import OpenRouterClient
-
-        # Use unified OpenRouter client
-        client = OpenRouterClient(api_key=api_key, http_client=http_client, config_obj=config_obj)
-        batch_info = f"Batch ({len(jobs)} jobs, Model: {model})"
+        batch_info = f"Batch ({len(jobs)} jobs, Model: {settings.model})"
 
         # Prepare batch metadata for thinking export
         batch_metadata = [
             {
-                "refnr": job.get("refnr", f"JOB_{i:03d}"),
+                "refnr": refnr,
                 "titel": job.get("titel", "N/A"),
                 "ort": job.get("ort", "N/A"),
                 "arbeitgeber": job.get("arbeitgeber", "N/A"),
             }
-            for i, job in enumerate(jobs)
+            for job, refnr in zip(jobs, id_to_refnr.values(), strict=True)
         ]
 
-        content, full_response = client.complete(
+        content, full_response = settings.client.complete(
             prompt=prompt,
-            model=model,
-            temperature=config_obj.get_required("llm.inference.temperature"),
-            extra_params=extra_api_params,
-            timeout=config_obj.get("api.timeouts.mega_batch_classification", 120),
+            model=settings.model,
+            temperature=settings.temperature,
+            extra_params=settings.extra_api_params,
+            timeout=settings.timeout,
             session=session,
             interaction_label=batch_info,
             batch_metadata=batch_metadata,
         )
 
         # Parse results line by line using simple ID format
+        categories_set = frozenset(settings.categories)
+        num_jobs = len(jobs)
         batch_results = {}
-        for line in content.split("\n"):
-            line = line.strip()
-            if not line:
-                continue
+        for simple_id, cats_str in _iter_result_lines(content):
+            cats = [c.strip() for c in cats_str.split(",")]
+
+            # Fail on invalid categories - no silent errors!
+            # (all-valid is the common case; only list the offenders on failure)
+            if not categories_set.issuperset(cats):
+                invalid_cats = [cat for cat in cats if cat not in categories_set]
+                # Map simple ID to actual refnr for error reporting
+                actual_refnr = id_to_refnr.get(simple_id, simple_id)
+                error_msg = (
+                    f"CRITICAL ERROR: LLM returned invalid categories in batch!\n"
+                    f"  Job ID: [{simple_id}] (refnr: {actual_refnr})\n"
+                    f"  Expected categories: {settings.categories}\n"
+                    f"  LLM returned: {cats}\n"
+                    f"  Invalid categories: {invalid_cats}\n"
+                    f"  This indicates the LLM failed to follow instructions.\n"
+                    f"  NO SILENT FAILURES - aborting batch to prevent data corruption!"
+                )
+                logger.error(error_msg)
+                raise LLMDataIntegrityError(
+                    error_msg,
+                    expected_count=len(settings.categories),
+                    actual_count=len(cats),
+                )
 
-            # Match pattern: [001] - Category
-            # Accept dash (-) as separator (no more unicode arrows)
-            match = re.match(r"\[(\d{3})\]\s*-\s*(.+)", line)
-            if match:
-                simple_id = match.group(1).strip()
-                cats_str = match.group(2).strip()
-                cats = [c.strip() for c in cats_str.split(",")]
-
-                # Validate categories
-                valid_cats = [cat for cat in cats if cat in categories]
-                invalid_cats = [cat for cat in cats if cat not in categories]
-
-                # Fail on invalid categories - no silent errors!
-                if invalid_cats:
-                    # Map simple ID to actual refnr for error reporting
-                    actual_refnr = id_to_refnr.get(simple_id, simple_id)
-                    error_msg = (
-                        f"CRITICAL ERROR: LLM returned invalid categories in batch!\n"
-                        f"  Job ID: [{simple_id}] (refnr: {actual_refnr})\n"
-                        f"  Expected categories: {categories}\n"
-                        f"  LLM returned: {cats}\n"
-                        f"  Invalid categories: {invalid_cats}\n"
-                        f"  This indicates the LLM failed to follow instructions.\n"
-                        f"  NO SILENT FAILURES - aborting batch to prevent data corruption!"
-                    )
-                    logger.error(error_msg)
-                    raise LLMDataIntegrityError(
-                        error_msg,
-                        expected_count=len(categories),
-                        actual_count=len(cats),
-                    )
-
-                # Convert simple ID to batch index (001 -> 0, 002 -> 1, etc.)
-                job_idx = int(simple_id) - 1
-                if 0 <= job_idx < len(jobs):
-                    batch_results[job_idx] = valid_cats
-
-        # Check if we got results for all jobs
-        missing_jobs = [i for i in range(len(jobs)) if i not in batch_results]
-
-        if missing_jobs:
+            # Convert simple ID to batch index (001 -> 0, 002 -> 1, etc.)
+            job_idx = int(simple_id) - 1
+            if 0 <= job_idx < num_jobs:
+                batch_results[job_idx] = cats
+
+        # Check if we got results for all jobs (keys are limited to range(num_jobs),
+        # so a full count means nothing is missing)
+        if len(batch_results) < num_jobs:
+            missing_jobs = sorted(set(range(num_jobs)) - batch_results.keys())
             error_msg = (
                 f"CRITICAL ERROR: Batch returned incomplete results!\n"
-                f"  Expected {len(jobs)} jobs, got {len(batch_results)} results.\n"
+                f"  Expected {num_jobs} jobs, got {len(batch_results)} results.\n"
                 f"  Missing job indices: {missing_jobs}\n"
                 f"  This is a CATASTROPHIC failure - jobs may be misaligned!\n"
                 f"  Possible causes:\n"
@@ -356,7 +658,7 @@ Return ONLY the lines with job IDs and categories, nothing else.
             logger.error(error_msg)
             raise LLMDataIntegrityError(
                 error_msg,
-                expected_count=len(jobs),
+                expected_count=num_jobs,
                 actual_count=len(batch_results),
                 missing_indices=missing_jobs,
             )
@@ -364,15 +666,12 @@ Return ONLY the lines with job IDs and categories, nothing else.
         # Assign results to jobs
         classified_jobs = []
         for idx, job in enumerate(jobs):
-            job_copy = job.copy()
-            # Direct access - should never fail due to missing_jobs check above
-            if idx not in batch_results:
-                raise AssertionError(
-                    f"FATAL: Job index {idx} missing from batch_results despite passing "
-                    f"missing_jobs check! This should never happen."
-                )
-            job_copy["categories"] = batch_results[idx]
-            classified_jobs.append(job_copy)
+            # Direct access - every index is present after the missing_jobs check above
+            if settings.copy_inputs:
+                classified_jobs.append({**job, "categories": batch_results[idx]})
+            else:
+                job["categories"] = batch_results[idx]
+                classified_jobs.append(job)
 
         # Print usage stats from full response
         usage = full_response.get("usage", {})
@@ -11,10 +11,18 @@ import yaml
 
 from src.exceptions import ConfigurationError
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Marks paths that are not present in the config (None is a valid config value)
+_MISSING = object()
+
 
 class Config:
     """Configuration manager that loads and provides access to all config files."""
 
+    __slots__ = ("_config_dir", "_configs", "_resolved")
+
     def __init__(self, config_dict: dict[str, Any] | None = None):
         """
         Initialize the configuration manager.
@@ -25,6 +33,8 @@ class Config:
         """
         self._configs: dict[str, Any]
         self._config_dir: Path | None
+        # Resolved dot paths -> value (or _MISSING), cleared whenever the config changes
+        self._resolved: dict[str, Any] = {}
 
         if config_dict is not None:
             # Testing mode: use provided config
@@ -69,8 +79,8 @@ class Config:
         for key, filename in config_files.items():
             config_path = self._config_dir / filename
             if config_path.exists():
-                with open(config_path, encoding="utf-8") as f:
-                    loaded_config = yaml.safe_load(f)
+                # Hand the raw bytes to the parser - it detects and decodes UTF-8 itself
+                loaded_config = yaml.load(config_path.read_bytes(), Loader=_YAML_LOADER)
 
                 # Validate that loaded config is a dictionary
                 if not isinstance(loaded_config, dict):
@@ -85,6 +95,31 @@ class Config:
                 print(f"Warning: Config file {filename} not found at {config_path}")
                 self._configs[key] = {}
 
+    def _resolve(self, path: str) -> Any:
+        """Look up a dot path, walking the nested dicts only on the first request.
+
+        Args:
+            path: Dot-separated path to the config value
+
+        Returns:
+            The configuration value, or _MISSING if the path does not exist
+        """
+        try:
+            return self._resolved[path]
+        except KeyError:
+            pass
+
+        value: Any = self._configs
+        for part in path.split("."):
+            if isinstance(value, dict) and part in value:
+                value = value[part]
+            else:
+                value = _MISSING
+                break
+
+        self._resolved[path] = value
+        return value
+
     def get(self, path: str, default: Any = None) -> Any:
         """Get a configuration value using dot notation.
 
@@ -100,17 +135,13 @@ class Config:
             30
             >>> config.get("llm.models.default")
             "google/gemini-2.5-flash"
-        """
-        parts = path.split(".")
-        value = self._configs
 
-        for part in parts:
-            if isinstance(value, dict) and part in value:
-                value = value[part]
-            else:
-                return default
-
-        return value
+        Note:
+            Lookups are cached per path. Change values through set() or reload(),
+            not by mutating returned dicts.
+        """
+        value = self._resolve(path)
+        return default if value is _MISSING else value
 
     def get_required(self, path: str) -> Any:
         """Get a required configuration value. Raises ConfigurationError if missing.
@@ -131,17 +162,12 @@ class Config:
             >>> config.get_required("llm.inference.temperature")
             0.2
         """
-        parts = path.split(".")
-        value = self._configs
-
-        for part in parts:
-            if isinstance(value, dict) and part in value:
-                value = value[part]
-            else:
-                raise ConfigurationError(
-                    f"Required configuration value not found. Please add '{path}' to your config file.",
-                    config_key=path,
-                )
+        value = self._resolve(path)
+        if value is _MISSING:
+            raise ConfigurationError(
+                f"Required configuration value not found. Please add '{path}' to your config file.",
+                config_key=path,
+            )
 
         return value
 
@@ -166,6 +192,7 @@ class Config:
 
         # Set the final value
         current[parts[-1]] = value
+        self._resolved.clear()
 
     @property
     def api(self) -> dict[str, Any]:
@@ -206,6 +233,7 @@ class Config:
     def reload(self):
         """Reload all configuration files."""
         self._configs.clear()
+        self._resolved.clear()
         self._load_all_configs()
 
 
@@ -30,6 +30,8 @@ class JobGatherer:
     3. Extract and clean data
     """
 
+    __slots__ = ("database", "session", "verbose")
+
     def __init__(
         self,
         session: Optional["SearchSession"] = None,
@@ -95,6 +97,9 @@ class JobGatherer:
         if scraping_delay is None:
             scraping_delay = config.get("api.delays.scraping", 1.0)
 
+        # Identifies this search in the database (search history and merge)
+        search_params = {"was": was, "wo": wo, "umkreis": umkreis}
+
         # Database logic: determine if we should do incremental fetch
         database_exists = use_database and self.database.exists()
 
@@ -110,7 +115,6 @@ class JobGatherer:
                 raise ValueError("Geographic context mismatch - see error above")
 
             # Check if this search criteria has been used before
-            search_params = {"was": was, "wo": wo, "umkreis": umkreis}
             has_history = self.database.has_search_history(search_params)
 
             # Only use incremental fetch if we've searched with these exact criteria before
@@ -165,25 +169,8 @@ class JobGatherer:
             logger.warning("No jobs found from API.")
             if database_exists:
                 logger.info("Database still contains existing jobs - no new updates to process")
-                return (
-                    [],
-                    [],
-                    {
-                        "total_found": 0,
-                        "total_scraped": 0,
-                        "successfully_extracted": 0,
-                        "failed": 0,
-                        "database_total": len(self.database.jobs),
-                        "new_jobs": 0,
-                        "updated_jobs": 0,
-                        "unchanged_jobs": 0,
-                    },
-                )
-            return (
-                [],
-                [],
-                {"total_found": 0, "total_scraped": 0, "successfully_extracted": 0, "failed": 0},
-            )
+                return [], [], self._build_stats(delta=self.database.get_delta_summary())
+            return [], [], self._build_stats()
 
         total_jobs_from_api = len(jobs)
         logger.info(f"✓ Found {total_jobs_from_api} jobs from API")
@@ -192,13 +179,14 @@ class JobGatherer:
         jobs_to_process = jobs  # By default, process all jobs
         new_jobs: list[dict] = []
         updated_jobs: list[dict] = []
+        # Counts only change on merge - scraping and saving keep them as they are
+        delta_summary: dict | None = None
 
         if use_database:
-            search_params = {"was": was, "wo": wo, "umkreis": umkreis}
             new_jobs, updated_jobs, _unchanged_jobs = self.database.merge(jobs, search_params)
 
             # Only process NEW and UPDATED jobs (skip unchanged)
-            jobs_to_process = new_jobs + updated_jobs
+            jobs_to_process = [*new_jobs, *updated_jobs]
 
             delta_summary = self.database.get_delta_summary()
             logger.info(
@@ -215,16 +203,7 @@ class JobGatherer:
                 return (
                     [],
                     [],
-                    {
-                        "total_found": total_jobs_from_api,
-                        "total_scraped": 0,
-                        "successfully_extracted": 0,
-                        "failed": 0,
-                        "database_total": len(self.database.jobs),
-                        "new_jobs": delta_summary["new"],
-                        "updated_jobs": delta_summary["updated"],
-                        "unchanged_jobs": delta_summary["unchanged"],
-                    },
+                    self._build_stats(total_found=total_jobs_from_api, delta=delta_summary),
                 )
 
             logger.info(f"Will scrape {len(jobs_to_process)} jobs (new + updated)")
@@ -239,24 +218,12 @@ class JobGatherer:
             if use_database:
                 self.database.save()
 
-            stats = {
-                "total_found": total_jobs_from_api,
-                "total_scraped": len(jobs_to_process),
-                "successfully_extracted": len(jobs_to_process),
-                "failed": 0,
-            }
-
-            if use_database:
-                delta_summary = self.database.get_delta_summary()
-                stats.update(
-                    {
-                        "database_total": len(self.database.jobs),
-                        "new_jobs": delta_summary["new"],
-                        "updated_jobs": delta_summary["updated"],
-                        "unchanged_jobs": delta_summary["unchanged"],
-                    }
-                )
-
+            stats = self._build_stats(
+                total_found=total_jobs_from_api,
+                total_scraped=len(jobs_to_process),
+                successfully_extracted=len(jobs_to_process),
+                delta=delta_summary,
+            )
             return jobs_to_process, [], stats
 
         logger.info("Fetching detailed job descriptions...")
@@ -280,35 +247,66 @@ class JobGatherer:
         # Step 3: Update database with scraped details
         if use_database:
             logger.info("Updating database with scraped details...")
-            for job in detailed_jobs:
-                refnr = job.get("refnr")
-                details = job.get("details", {})
-                if refnr and details:
-                    self.database.update_details(refnr, details)
+            self.database.update_details_bulk(
+                {
+                    job["refnr"]: job["details"]
+                    for job in detailed_jobs
+                    if job.get("refnr") and job.get("details")
+                }
+            )
 
             # Save updated database
             self.database.save()
             logger.info(f"✓ Database saved to {self.database.database_path}")
 
+        stats = self._build_stats(
+            total_found=total_jobs_from_api,
+            total_scraped=len(detailed_jobs),
+            successfully_extracted=len(extracted_jobs),
+            failed=len(failed_jobs),
+            delta=delta_summary,
+        )
+        return extracted_jobs, failed_jobs, stats
+
+    def _build_stats(
+        self,
+        *,
+        total_found: int = 0,
+        total_scraped: int = 0,
+        successfully_extracted: int = 0,
+        failed: int = 0,
+        delta: dict | None = None,
+    ) -> dict:
+        """
+        Build the gathering statistics returned by gather()
+
+        Args:
+            total_found: Number of jobs returned by the API
+            total_scraped: Number of jobs passed to the scraper
+            successfully_extracted: Number of jobs with a usable description
+            failed: Number of jobs that failed to scrape
+            delta: Database delta summary (see JobDatabase.get_delta_summary), None if
+                   the database is disabled
+
+        Returns:
+            Statistics dict (database counts are only included when delta is given)
+        """
         stats = {
-            "total_found": total_jobs_from_api,
-            "total_scraped": len(detailed_jobs),
-            "successfully_extracted": len(extracted_jobs),
-            "failed": len(failed_jobs),
+            "total_found": total_found,
+            "total_scraped": total_scraped,
+            "successfully_extracted": successfully_extracted,
+            "failed": failed,
         }
-
-        if use_database:
-            delta_summary = self.database.get_delta_summary()
+        if delta is not None:
             stats.update(
                 {
-                    "database_total": len(self.database.jobs),
-                    "new_jobs": delta_summary["new"],
-                    "updated_jobs": delta_summary["updated"],
-                    "unchanged_jobs": delta_summary["unchanged"],
+                    "database_total": delta["total_in_database"],
+                    "new_jobs": delta["new"],
+                    "updated_jobs": delta["updated"],
+                    "unchanged_jobs": delta["unchanged"],
                 }
             )
-
-        return extracted_jobs, failed_jobs, stats
+        return stats
 
     def gather_from_raw_data(self, jobs: list[dict]) -> list[dict]:
         """
@@ -12,11 +12,13 @@ Note: Classification status is NOT tracked here. Use session checkpoints for
 classification recovery (see SearchSession.save_checkpoint/load_checkpoint).
 """
 
-import json
 import logging
 from datetime import datetime
 from pathlib import Path
 
+from ..json_utils import dumps as json_dumps
+from ..json_utils import loads as json_loads
+
 logger = logging.getLogger(__name__)
 
 
@@ -77,8 +79,7 @@ class JobDatabase:
             return False
 
         try:
-            with open(self.database_path, encoding="utf-8") as f:
-                data = json.load(f)
+            data = json_loads(self.database_path.read_bytes())
 
             self.metadata = data.get("metadata", {})
             self.jobs = data.get("jobs", {})
@@ -101,7 +102,8 @@ class JobDatabase:
         - modifikationsTimestamp (modification timestamp)
 
         Args:
-            api_jobs: List of jobs from API (must include modifikationsTimestamp)
+            api_jobs: List of jobs from API (must include modifikationsTimestamp).
+                New and updated jobs are stored as these dicts, with metadata added in place.
             search_params: Search parameters that found these jobs
 
         Returns:
@@ -112,6 +114,11 @@ class JobDatabase:
         unchanged_jobs = []
 
         current_time = datetime.now().isoformat()
+        was = search_params.get("was")
+        wo = search_params.get("wo")
+
+        # Checked once - the per-job debug message is only formatted when it will be emitted
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
 
         for api_job in api_jobs:
             refnr = api_job.get("refnr")
@@ -123,24 +130,16 @@ class JobDatabase:
 
             if refnr not in self.jobs:
                 # New job - never seen before
-                job_entry = {
-                    **api_job,
-                    "metadata": {
-                        "first_seen": current_time,
-                        "last_seen": current_time,
-                    },
-                    "found_in_searches": [
-                        {
-                            "was": search_params.get("was"),
-                            "wo": search_params.get("wo"),
-                            "first_match": current_time,
-                        }
-                    ],
+                api_job["metadata"] = {
+                    "first_seen": current_time,
+                    "last_seen": current_time,
                 }
-                self.jobs[refnr] = job_entry
+                api_job["found_in_searches"] = [{"was": was, "wo": wo, "first_match": current_time}]
+                self.jobs[refnr] = api_job
                 self.new_jobs.add(refnr)
-                new_jobs.append(job_entry)
-                logger.debug(f"New job: {refnr} - {api_job.get('beruf')}")
+                new_jobs.append(api_job)
+                if debug_enabled:
+                    logger.debug(f"New job: {refnr} - {api_job.get('beruf')}")
 
             else:
                 # Existing job - check if modified
@@ -152,18 +151,8 @@ class JobDatabase:
 
                 # Check if this search already found this job
                 found_in_searches = existing_job.get("found_in_searches", [])
-                search_key = (search_params.get("was"), search_params.get("wo"))
-                if not any(
-                    s.get("was") == search_key[0] and s.get("wo") == search_key[1]
-                    for s in found_in_searches
-                ):
-                    found_in_searches.append(
-                        {
-                            "was": search_params.get("was"),
-                            "wo": search_params.get("wo"),
-                            "first_match": current_time,
-                        }
-                    )
+                if not any(s.get("was") == was and s.get("wo") == wo for s in found_in_searches):
+                    found_in_searches.append({"was": was, "wo": wo, "first_match": current_time})
                     existing_job["found_in_searches"] = found_in_searches
 
                 # Compare modification timestamps
@@ -174,18 +163,16 @@ class JobDatabase:
                     # Update job data but preserve metadata
                     old_metadata = existing_job.get("metadata", {})
 
-                    # Update with new API data
-                    self.jobs[refnr] = {
-                        **api_job,
-                        "metadata": {
-                            **old_metadata,
-                            "last_seen": current_time,
-                        },
-                        "found_in_searches": found_in_searches,
+                    # Replace with new API data
+                    api_job["metadata"] = {
+                        **old_metadata,
+                        "last_seen": current_time,
                     }
+                    api_job["found_in_searches"] = found_in_searches
+                    self.jobs[refnr] = api_job
 
                     self.updated_jobs.add(refnr)
-                    updated_jobs.append(self.jobs[refnr])
+                    updated_jobs.append(api_job)
                 else:
                     # Job unchanged
                     self.unchanged_jobs.add(refnr)
@@ -199,10 +186,11 @@ class JobDatabase:
     def save(self):
         """Save database to disk."""
         # Update metadata
+        now = datetime.now().isoformat()
         if self.metadata.get("created") is None:
-            self.metadata["created"] = datetime.now().isoformat()
+            self.metadata["created"] = now
 
-        self.metadata["last_updated"] = datetime.now().isoformat()
+        self.metadata["last_updated"] = now
         self.metadata["total_jobs"] = len(self.jobs)
         self.metadata["active_jobs"] = len(self.jobs)  # All jobs are active (deleted ones removed)
 
@@ -211,9 +199,7 @@ class JobDatabase:
 
         # Save to file
         data = {"metadata": self.metadata, "jobs": self.jobs}
-
-        with open(self.database_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        self.database_path.write_bytes(json_dumps(data, indent=True))
 
         logger.info(f"Database saved to {self.database_path} ({len(self.jobs)} jobs)")
 
@@ -225,8 +211,20 @@ class JobDatabase:
             refnr: Job reference number
             details: Details dictionary from scraper
         """
-        if refnr in self.jobs:
-            self.jobs[refnr]["details"] = details
+        self.update_details_bulk({refnr: details})
+
+    def update_details_bulk(self, details_by_refnr: dict[str, dict]):
+        """
+        Update scraped details for many jobs in one pass.
+
+        Args:
+            details_by_refnr: Mapping of job reference number -> details dictionary
+        """
+        jobs = self.jobs
+        for refnr, details in details_by_refnr.items():
+            job = jobs.get(refnr)
+            if job is not None:
+                job["details"] = details
 
     def get_delta_summary(self) -> dict:
         """
@@ -1,8 +1,14 @@
 """HTTP client abstraction for dependency injection and testability."""
 
+from http.cookiejar import DefaultCookiePolicy
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
+
+# Connections kept alive per host. Should cover the number of concurrent
+# classification batches (processing.limits.batch_max_workers).
+DEFAULT_POOL_MAXSIZE = 16
 
 
 class HttpClient:
@@ -13,8 +19,42 @@ class HttpClient:
     - Dependency injection for testing
     - Easy mocking in unit tests
     - Centralized HTTP configuration
+
+    Requests go through one long-lived requests.Session, so TCP/TLS connections
+    are pooled and kept alive between calls to the same host instead of being
+    re-established for every request.
+
+    Only connections are shared, not state: the session created here never stores
+    cookies, so a cookie set by one request is not sent with any later request.
+    Otherwise consent-wall or bot-protection cookies from one scraped page would
+    be sent along with later requests to that site. Cookies still apply within a
+    single request, including its redirects (requests tracks those separately
+    from the session).
     """
 
+    def __init__(
+        self,
+        session: requests.Session | None = None,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+    ):
+        """
+        Initialize the HTTP client.
+
+        Args:
+            session: Optional preconfigured requests.Session, used as given
+                     (a new cookie-less one is created if None)
+            pool_maxsize: Maximum number of kept-alive connections per host
+        """
+        self.session = session or requests.Session()
+
+        if session is None:
+            # Reject all cookies - allowed_domains=[] matches no domain
+            self.session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+
+            adapter = HTTPAdapter(pool_maxsize=pool_maxsize)
+            self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
+
     def get(
         self,
         url: str,
@@ -31,12 +71,12 @@ class HttpClient:
             headers: Optional HTTP headers
             params: Optional query parameters
             timeout: Optional request timeout in seconds
-            **kwargs: Additional arguments to pass to requests.get()
+            **kwargs: Additional arguments to pass to requests.Session.get()
 
         Returns:
             requests.Response object
         """
-        return requests.get(url, headers=headers, params=params, timeout=timeout, **kwargs)
+        return self.session.get(url, headers=headers, params=params, timeout=timeout, **kwargs)
 
     def post(
         self,
@@ -54,15 +94,22 @@ class HttpClient:
             url: URL to request
             headers: Optional HTTP headers
             json: Optional JSON data to send
-            data: Optional form data to send
+            data: Optional form data or pre-encoded body to send
             timeout: Optional request timeout in seconds
-            **kwargs: Additional arguments to pass to requests.post()
+            **kwargs: Additional arguments to pass to requests.Session.post()
 
         Returns:
             requests.Response object
         """
-        return requests.post(url, headers=headers, json=json, data=data, timeout=timeout, **kwargs)
+        return self.session.post(
+            url, headers=headers, json=json, data=data, timeout=timeout, **kwargs
+        )
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        self.session.close()
 
 
-# Create a default instance for backward compatibility
+# Shared instance used whenever no client is injected - reusing it keeps
+# connections alive across all API, scraping and LLM calls of a run
 default_http_client = HttpClient()
@@ -0,0 +1,49 @@
+"""
+JSON helpers with an optional fast path
+
+Uses orjson when it is installed (pip install -e ".[speedups]") and falls back
+to the standard library json module otherwise.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def loads(data: str | bytes) -> Any:
+    """
+    Deserialize a JSON document
+
+    Args:
+        data: JSON text as str or UTF-8 encoded bytes
+
+    Returns:
+        The decoded Python object
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize an object to UTF-8 encoded JSON
+
+    Args:
+        obj: JSON-serializable object
+        indent: Pretty-print with 2-space indentation (for files meant to be read by humans)
+
+    Returns:
+        JSON document as bytes (non-ASCII characters are not escaped)
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
@@ -13,6 +13,8 @@ from typing import TYPE_CHECKING, Optional
 from ..config import Config, config
 from ..exceptions import OpenRouterAPIError
 from ..http_client import HttpClient, default_http_client
+from ..json_utils import dumps as json_dumps
+from ..json_utils import loads as json_loads
 
 if TYPE_CHECKING:
     from ..session import SearchSession
@@ -48,6 +50,15 @@ class OpenRouterClient:
         self.http_client = http_client or default_http_client
         self.config = config_obj or config
 
+        # Same for every request - build once instead of per call
+        self.endpoint = self.config.get_required("api.openrouter.endpoint")
+        self.headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+            "HTTP-Referer": "https://github.com/vlzware/JobSuche-Py",
+            "X-Title": "JobSuche-Py",
+        }
+
     def complete(
         self,
         prompt: str,
@@ -99,14 +110,10 @@ class OpenRouterClient:
 
         # Make the request
         response = self.http_client.post(
-            url=self.config.get_required("api.openrouter.endpoint"),
-            headers={
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json",
-                "HTTP-Referer": "https://github.com/vlzware/JobSuche-Py",
-                "X-Title": "JobSuche-Py",
-            },
-            json=payload,
+            url=self.endpoint,
+            headers=self.headers,
+            # Serialize once to bytes ourselves instead of letting requests run json.dumps
+            data=json_dumps(payload),
             timeout=timeout,
         )
 
@@ -119,8 +126,8 @@ class OpenRouterClient:
                 response_text=response.text,
             )
 
-        # Parse response
-        full_response = response.json()
+        # Parse response (decode the raw body directly - avoids requests' text detour)
+        full_response = json_loads(response.content)
         content = full_response.get("choices", [{}])[0].get("message", {}).get("content", "")
 
         # Save to session if provided
@@ -6,6 +6,7 @@ for different classification strategies.
 """
 
 import os
+from pathlib import Path
 from typing import TYPE_CHECKING, Optional
 
 from ..classifier import classify_jobs_batch
@@ -17,6 +18,7 @@ from ..prompts import (
     PERFECT_JOB_TEMPLATE,
     load_custom_prompts,
 )
+from .result_cache import ClassificationCache
 
 logger = get_module_logger("llm_processor")
 
@@ -65,6 +67,16 @@ class LLMProcessor:
         # Load custom prompts if available
         self.custom_prompts = load_custom_prompts()
 
+        # Persistent cache of earlier classification results (opened lazily)
+        self.result_cache: ClassificationCache | None = None
+        if config.get("processing.cache.enabled", False):
+            # Check for environment variable override (useful for testing)
+            cache_path = os.environ.get(
+                "JOBSUCHE_CLASSIFICATION_CACHE",
+                config.get("paths.files.classification_cache", "data/cache/classifications.sqlite"),
+            )
+            self.result_cache = ClassificationCache(Path(cache_path))
+
     def _classify_internal(
         self,
         jobs: list[dict],
@@ -85,6 +97,10 @@ class LLMProcessor:
 
         Returns:
             List of jobs with 'categories' field added
+
+        Note:
+            The 'categories' field is added to the given job dicts in place
+            (the workflows own these lists, so copying every job is wasted work).
         """
         logger.info(f"Classifying jobs using {self.model}...")
         logger.info(f"  Categories: {', '.join(categories)}")
@@ -105,6 +121,8 @@ class LLMProcessor:
             extra_api_params=extra_api_params,
             session=self.session,
             category_definitions=category_definitions,
+            result_cache=self.result_cache,
+            copy_inputs=False,
         )
 
     def classify_matching(
@@ -138,7 +156,8 @@ class LLMProcessor:
             extra_api_params: Additional API parameters (e.g., {"reasoning": {"effort": "high"}})
 
         Returns:
-            List of jobs with 'categories' field (filtered if return_only_matches=True)
+            List of jobs with 'categories' field (filtered if return_only_matches=True).
+            The field is added to the given job dicts in place.
 
         Raises:
             ValueError: If neither CV nor perfect job description provided
@@ -0,0 +1,146 @@
+"""
+Persistent cache of LLM classification results
+
+Stores the categories assigned to a job keyed by a content hash of everything
+that influences the result: model, categories, category guidance (CV / perfect
+job description), extra API parameters, sampling temperature, the batch prompt
+template and the job text itself. Re-running a classification with unchanged
+inputs (reposted listings, re-classifying the database with the same profile)
+is served from disk instead of the LLM.
+
+Changing any of those inputs produces a different key, so updated CVs or
+prompts are always classified fresh. Delete the cache file to force
+re-classification of everything.
+"""
+
+import hashlib
+import json
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+
+from ..logging_config import get_module_logger
+
+logger = get_module_logger("result_cache")
+
+# SQLite limits the number of bound parameters per statement
+_LOOKUP_CHUNK_SIZE = 500
+
+
+class ClassificationCache:
+    """
+    SQLite-backed store of classification results keyed by content hash
+
+    The database file is created lazily on first write, so constructing the
+    cache has no side effects.
+    """
+
+    def __init__(self, cache_path: Path):
+        """
+        Initialize the cache
+
+        Args:
+            cache_path: Path to the SQLite file (parent directories are created on demand)
+        """
+        self.cache_path = Path(cache_path)
+
+    @staticmethod
+    def context_key(
+        model: str,
+        categories: list[str],
+        guidance: str,
+        extra_api_params: dict | None = None,
+        temperature: float | None = None,
+        prompt_template: str = "",
+    ) -> str:
+        """
+        Hash the classification context shared by all jobs of a run
+
+        Args:
+            model: Model identifier
+            categories: Category names (order matters - it determines the fallback)
+            guidance: Category guidance included in the prompt
+            extra_api_params: Additional API parameters (e.g., reasoning effort)
+            temperature: Sampling temperature of the requests
+            prompt_template: Batch prompt the job texts are inserted into
+
+        Returns:
+            Hex digest identifying the context
+        """
+        context = json.dumps(
+            [model, categories, guidance, extra_api_params or {}, temperature, prompt_template],
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(context.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def job_key(context_key: str, job_text: str) -> str:
+        """
+        Hash a single job's text within a classification context
+
+        Args:
+            context_key: Result of context_key()
+            job_text: The job description sent to the LLM
+
+        Returns:
+            Hex digest used as cache key
+        """
+        return hashlib.sha256(f"{context_key}\0{job_text}".encode()).hexdigest()
+
+    def get_many(self, keys: list[str]) -> dict[str, list[str]]:
+        """
+        Look up cached results
+
+        Args:
+            keys: Cache keys (see job_key)
+
+        Returns:
+            Dict of key -> categories for every key that was found
+        """
+        if not keys or not self.cache_path.exists():
+            return {}
+
+        found: dict[str, list[str]] = {}
+        try:
+            with closing(sqlite3.connect(self.cache_path)) as conn:
+                unique_keys = list(dict.fromkeys(keys))
+                for start in range(0, len(unique_keys), _LOOKUP_CHUNK_SIZE):
+                    chunk = unique_keys[start : start + _LOOKUP_CHUNK_SIZE]
+                    placeholders = ",".join("?" * len(chunk))
+                    rows = conn.execute(
+                        f"SELECT key, categories FROM classifications WHERE key IN ({placeholders})",
+                        chunk,
+                    )
+                    for key, categories in rows:
+                        found[key] = json.loads(categories)
+        except sqlite3.Error as e:
+            # A broken cache must never block classification - just miss
+            logger.warning(f"Classification cache unavailable ({self.cache_path}): {e}")
+            return {}
+
+        return found
+
+    def put_many(self, results: dict[str, list[str]]) -> None:
+        """
+        Store classification results
+
+        Args:
+            results: Dict of key -> categories
+        """
+        if not results:
+            return
+
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with closing(sqlite3.connect(self.cache_path)) as conn, conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS classifications "
+                    "(key TEXT PRIMARY KEY, categories TEXT NOT NULL)"
+                )
+                conn.executemany(
+                    "INSERT OR REPLACE INTO classifications (key, categories) VALUES (?, ?)",
+                    [(key, json.dumps(cats, ensure_ascii=False)) for key, cats in results.items()],
+                )
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Could not write classification cache ({self.cache_path}): {e}")
@@ -13,6 +13,8 @@ try:
     import yaml
 
     YAML_AVAILABLE = True
+    # Prefer the libyaml-backed loader when PyYAML was built with it
+    _YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 except ImportError:
     YAML_AVAILABLE = False
 
@@ -75,6 +77,11 @@ Evaluation principles:
 6. When in doubt between Good and Poor, choose Poor"""
 
 
+# Parsed prompts keyed by (resolved path, mtime_ns, size) so repeated loads
+# of an unchanged file skip the YAML parse
+_PROMPTS_CACHE: dict[tuple[str, int, int], dict[str, str]] = {}
+
+
 def load_custom_prompts(config_path: str | None = None) -> dict[str, str]:
     """
     Load custom prompt templates from YAML config file.
@@ -84,6 +91,9 @@ def load_custom_prompts(config_path: str | None = None) -> dict[str, str]:
 
     Returns:
         Dictionary of prompt names to template strings
+
+    Note:
+        Results are cached per file and reused until the file's mtime or size changes.
     """
     if not YAML_AVAILABLE:
         return {}
@@ -92,12 +102,19 @@ def load_custom_prompts(config_path: str | None = None) -> dict[str, str]:
         config_path = config.get("paths.files.prompts", "prompts.yaml")
 
     config_file = Path(config_path)
-    if not config_file.exists():
+    try:
+        st = config_file.stat()
+    except OSError:
         return {}
 
+    cache_key = (str(config_file.resolve()), st.st_mtime_ns, st.st_size)
+    cached = _PROMPTS_CACHE.get(cache_key)
+    if cached is not None:
+        return dict(cached)
+
     try:
         with open(config_file, encoding="utf-8") as f:
-            prompts_config = yaml.safe_load(f)
+            prompts_config = yaml.load(f, Loader=_YAML_LOADER)
 
         if not prompts_config or "prompts" not in prompts_config:
             return {}
@@ -126,7 +143,8 @@ def load_custom_prompts(config_path: str | None = None) -> dict[str, str]:
                 )
                 return {}
 
-        return prompts
+        _PROMPTS_CACHE[cache_key] = prompts
+        return dict(prompts)
     except Exception as e:
         print(f"Warning: Could not load custom prompts from {config_path}: {e}")
         return {}
@@ -677,8 +677,11 @@ def fetch_detailed_listings(
         "failed_jobs": [],  # List of failed job details
     }
 
+    # Per-job details go to the debug log; the console gets ~20 progress lines
+    progress_every = max(1, len(jobs) // 20)
+
     for idx, job in enumerate(jobs, 1):
-        logger.info(f"Fetching details for job {idx}/{len(jobs)}: {job.get('beruf', 'N/A')}")
+        logger.debug(f"Fetching details for job {idx}/{len(jobs)}: {job.get('beruf', 'N/A')}")
 
         # Create a copy of the original job data
         detailed_job = job.copy()
@@ -688,11 +691,11 @@ def fetch_detailed_listings(
 
         if external_url and external_url.strip():
             # External website
-            logger.info(f"  Fetching from external URL: {external_url}")
+            logger.debug(f"  Fetching from external URL: {external_url}")
             details = fetch_external_details(external_url, http_client, config_obj)
         elif refnr:
             # Internal Arbeitsagentur page
-            logger.info(f"  Fetching from Arbeitsagentur: {refnr}")
+            logger.debug(f"  Fetching from Arbeitsagentur: {refnr}")
             details = fetch_arbeitsagentur_details(refnr, http_client, config_obj)
         else:
             logger.warning("  No detail URL available")
@@ -710,7 +713,7 @@ def fetch_detailed_listings(
             error_stats["successful"] += 1
             text_len = details.get("text_length", len(details.get("text", "")))
             method = details.get("extraction_method", "unknown")
-            logger.info(f"  ✓ Job {idx} fetched successfully: {text_len} chars via {method}")
+            logger.debug(f"  ✓ Job {idx} fetched successfully: {text_len} chars via {method}")
         else:
             error_stats["failed"] += 1
 
@@ -734,18 +737,26 @@ def fetch_detailed_listings(
                 }
             )
 
+            # Per-job details go to the debug log only - failures are reported
+            # together in the error summary below and in scraping_errors.json
             error = details.get("error", "Unknown error")
             text_len = details.get("text_length", 0)
             if warning and warning != "UNKNOWN":
-                logger.warning(
+                logger.debug(
                     f"  ⚠ Job {idx} warning ({warning}): {error} "
                     f"(domain: {domain}, extracted: {text_len} chars)"
                 )
             else:
-                logger.warning(f"  ✗ Job {idx} failed: {error} (domain: {domain})")
+                logger.debug(f"  ✗ Job {idx} failed: {error} (domain: {domain})")
 
         detailed_jobs.append(detailed_job)
 
+        if idx % progress_every == 0 or idx == len(jobs):
+            logger.info(
+                f"  Fetched {idx}/{len(jobs)} job details "
+                f"({error_stats['successful']} successful, {error_stats['failed']} failed)"
+            )
+
         # Add delay to be respectful to servers
         if idx < len(jobs):
             time.sleep(delay)
@@ -4,12 +4,14 @@ Creates timestamped directories and manages all debug/output files
 """
 
 import json
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 from .config import config
 from .html_utils import get_category_css_class
+from .json_utils import dumps as json_dumps
 from .logging_config import setup_session_logging
 
 
@@ -69,6 +71,9 @@ class SearchSession:
         # Track all batch metadata for thinking index generation
         self.batch_metadata_tracker: list[dict] = []
 
+        # Serializes LLM interaction saves (batches may be classified concurrently)
+        self._interaction_lock = threading.Lock()
+
         self.logger.info(f"Initialized session: {timestamp}")
 
     # Debug artifacts (raw data for debugging)
@@ -157,6 +162,20 @@ class SearchSession:
             batch_metadata: Optional list of job metadata dicts for HTML export and index
                            [{"refnr": "...", "titel": "...", "ort": "...", "arbeitgeber": "..."}]
         """
+        # Filenames are picked by probing for existing files - hold the lock so
+        # concurrent batches can't claim the same name
+        with self._interaction_lock:
+            self._save_llm_interaction(prompt, content, full_response, label, batch_metadata)
+
+    def _save_llm_interaction(
+        self,
+        prompt: str,
+        content: str,
+        full_response: dict,
+        label: str,
+        batch_metadata: list[dict] | None,
+    ):
+        """Write the files for one LLM interaction (see save_llm_interaction)"""
         # Determine filename based on label or use counter
         if label:
             # Sanitize label for filename
@@ -186,8 +205,7 @@ class SearchSession:
 
         # Save full API response
         full_response_file = self.debug_dir / f"{base_name}_full_response.json"
-        with open(full_response_file, "w", encoding="utf-8") as f:
-            json.dump(full_response, f, ensure_ascii=False, indent=2)
+        full_response_file.write_bytes(json_dumps(full_response, indent=True))
 
         # Extract and save thinking process (if available)
         thinking = self._extract_thinking_process(full_response)
@@ -618,8 +636,7 @@ Structure:
             "total_batches": total_batches,
             "last_updated": datetime.now().isoformat(),
         }
-        with open(checkpoint_file, "w", encoding="utf-8") as f:
-            json.dump(checkpoint_data, f, ensure_ascii=False, indent=2)
+        checkpoint_file.write_bytes(json_dumps(checkpoint_data, indent=True))
 
     def load_checkpoint(self) -> dict | None:
         """
@@ -655,8 +672,7 @@ Structure:
         existing_results.extend(classified_jobs)
 
         # Save combined results
-        with open(partial_file, "w", encoding="utf-8") as f:
-            json.dump(existing_results, f, ensure_ascii=False, indent=2)
+        partial_file.write_bytes(json_dumps(existing_results, indent=True))
 
     def load_partial_results(self) -> list[dict]:
         """
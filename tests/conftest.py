@@ -34,8 +34,8 @@ def cli_test_env(tmp_path):
     """
     Environment variables for CLI subprocess tests.
 
-    Sets JOBSUCHE_SEARCHES_DIR and JOBSUCHE_DATABASE_PATH to temporary
-    directories to prevent pollution of the project's data directories.
+    Sets JOBSUCHE_SEARCHES_DIR, JOBSUCHE_DATABASE_PATH and JOBSUCHE_CLASSIFICATION_CACHE
+    to temporary paths to prevent pollution of the project's data directories.
 
     Usage:
         def test_something(cli_test_env):
@@ -48,4 +48,5 @@ def cli_test_env(tmp_path):
     env = os.environ.copy()
     env["JOBSUCHE_SEARCHES_DIR"] = str(tmp_path / "test_searches")
     env["JOBSUCHE_DATABASE_PATH"] = str(tmp_path / "test_database" / "jobs.json")
+    env["JOBSUCHE_CLASSIFICATION_CACHE"] = str(tmp_path / "test_cache" / "classifications.sqlite")
     return env
@@ -5,6 +5,7 @@ These tests cover error conditions that are unlikely to occur during normal usag
 but could cause issues if they do. Happy-path testing happens through real-world usage.
 """
 
+import json
 from unittest.mock import Mock, patch
 
 import pytest
@@ -36,6 +37,31 @@ class TestAPIClientErrors:
             with pytest.raises(ConnectionError):
                 search_jobs(was="test", wo="test")
 
+    def test_partial_results_on_failed_page(self):
+        """Test jobs from earlier pages are kept when a later page fails"""
+        from src.api_client import search_jobs, search_jobs_iter
+
+        ok_response = Mock(status_code=200)
+        ok_response.json.return_value = {
+            "stellenangebote": [{"refnr": "1", "beruf": "Entwickler"}],
+            "maxErgebnisse": "10",
+        }
+        error_response = Mock(status_code=500)
+
+        with patch("src.api_client.default_http_client") as mock_client:
+            mock_client.get.side_effect = [ok_response, error_response]
+            jobs = search_jobs(was="test", max_pages=3)
+
+        assert [job["refnr"] for job in jobs] == ["1"]
+
+        # The streaming variant yields page 1 before page 2 is requested
+        with patch("src.api_client.default_http_client") as mock_client:
+            mock_client.get.side_effect = [ok_response, error_response]
+            iterator = search_jobs_iter(was="test", max_pages=3)
+            assert next(iterator)["refnr"] == "1"
+            assert mock_client.get.call_count == 1
+            assert list(iterator) == []
+
 
 class TestClassifierErrors:
     """Test classifier error handling"""
@@ -56,6 +82,271 @@ class TestClassifierErrors:
                     jobs=jobs, categories=["Cat1"], api_key="invalid_key", model="test-model"
                 )
 
+    @staticmethod
+    def _llm_response(content):
+        """Build a successful OpenRouter response mock returning the given content"""
+        body = {"choices": [{"message": {"content": content}}]}
+        return Mock(status_code=200, content=json.dumps(body).encode())
+
+    def test_invalid_category_raises(self):
+        """Test categories outside the allowed list abort the batch"""
+        from src.classifier import classify_jobs_batch
+        from src.exceptions import LLMDataIntegrityError
+
+        jobs = [{"refnr": "123", "titel": "Test", "text": "Description"}]
+
+        with patch("src.classifier.default_http_client") as mock_client:
+            mock_client.post.return_value = self._llm_response("[001] - Made Up Category")
+
+            with pytest.raises(LLMDataIntegrityError):
+                classify_jobs_batch(
+                    jobs=jobs, categories=["Good Match", "Poor Match"], api_key="key", model="m"
+                )
+
+    def test_missing_job_in_response_raises(self):
+        """Test a response that skips a job is rejected instead of misaligning results"""
+        from src.classifier import classify_jobs_batch
+        from src.exceptions import LLMDataIntegrityError
+
+        jobs = [
+            {"refnr": "1", "titel": "A", "text": "First"},
+            {"refnr": "2", "titel": "B", "text": "Second"},
+        ]
+
+        with patch("src.classifier.default_http_client") as mock_client:
+            mock_client.post.return_value = self._llm_response("[002] - Good Match")
+
+            with pytest.raises(LLMDataIntegrityError) as exc_info:
+                classify_jobs_batch(
+                    jobs=jobs, categories=["Good Match", "Poor Match"], api_key="key", model="m"
+                )
+
+        assert exc_info.value.missing_indices == [0]
+
+    def test_concurrent_batches_keep_job_order(self):
+        """Test results of concurrently sent batches are not misaligned with their jobs"""
+        from src.classifier import classify_jobs_batch
+
+        jobs = [{"refnr": str(i), "titel": f"Job {i}", "text": f"Text {i}"} for i in range(5)]
+
+        def respond(url, headers=None, data=None, **kwargs):
+            # Answer "Good Match" only for the batch containing job "Text 2"
+            prompt = json.loads(data)["messages"][0]["content"]
+            count = prompt.count("Text ")
+            category = "Good Match" if "Text 2" in prompt else "Poor Match"
+            lines = "\n".join(f"[{n:03d}] - {category}" for n in range(1, count + 1))
+            return self._llm_response(lines)
+
+        with patch("src.classifier.default_http_client") as mock_client:
+            mock_client.post.side_effect = respond
+            classified = classify_jobs_batch(
+                jobs=jobs,
+                categories=["Good Match", "Poor Match"],
+                api_key="key",
+                model="m",
+                batch_size=2,
+            )
+
+        assert [job["refnr"] for job in classified] == ["0", "1", "2", "3", "4"]
+        assert [job["categories"] for job in classified] == [
+            ["Poor Match"],
+            ["Poor Match"],
+            ["Good Match"],
+            ["Good Match"],
+            ["Poor Match"],
+        ]
+
+    def test_failed_batch_keeps_results_of_batches_in_flight(self):
+        """Test batches already sent when another batch fails are checkpointed, not lost"""
+        import threading
+
+        from src.classifier import classify_jobs_batch
+        from src.exceptions import LLMDataIntegrityError
+
+        jobs = [{"refnr": str(i), "titel": f"Job {i}", "text": f"Text {i}"} for i in range(3)]
+        all_sent = threading.Barrier(3, timeout=5)
+
+        def respond(url, headers=None, data=None, **kwargs):
+            # Hold every request until all three batches are in flight, then fail batch 1
+            all_sent.wait()
+            prompt = json.loads(data)["messages"][0]["content"]
+            category = "Made Up" if "Text 0" in prompt else "Good Match"
+            return self._llm_response(f"[001] - {category}")
+
+        session = Mock()
+        session.load_partial_results.return_value = []
+
+        with patch("src.classifier.default_http_client") as mock_client:
+            mock_client.post.side_effect = respond
+            with pytest.raises(LLMDataIntegrityError):
+                classify_jobs_batch(
+                    jobs=jobs,
+                    categories=["Good Match", "Poor Match"],
+                    api_key="key",
+                    model="m",
+                    batch_size=1,
+                    session=session,
+                )
+
+        checkpoint = session.save_checkpoint.call_args.kwargs
+        assert sorted(checkpoint["completed_refnrs"]) == ["1", "2"]
+        assert checkpoint["pending_refnrs"] == ["0"]
+
+    def test_interrupt_does_not_wait_for_running_batches(self):
+        """Test Ctrl-C propagates out of classification while a request is still running
+
+        Only covers the classifier: the process itself exits via os._exit() in main.py,
+        because the interpreter would otherwise join the worker thread at exit.
+        """
+        import threading
+
+        from src.classifier import classify_jobs_batch
+
+        jobs = [{"refnr": str(i), "titel": f"Job {i}", "text": f"Text {i}"} for i in range(2)]
+        second_sent = threading.Event()
+        release = threading.Event()
+        finished = []
+
+        def respond(url, headers=None, data=None, **kwargs):
+            # Batch 2 hangs until released, like a slow LLM request; batch 1 answers
+            # once batch 2 is in flight
+            if "Text 1" in json.loads(data)["messages"][0]["content"]:
+                second_sent.set()
+                release.wait(timeout=5)
+            else:
+                second_sent.wait(timeout=5)
+            finished.append(data)
+            return self._llm_response("[001] - Good Match")
+
+        session = Mock()
+        session.load_partial_results.return_value = []
+        session.save_partial_results.side_effect = KeyboardInterrupt
+
+        with patch("src.classifier.default_http_client") as mock_client:
+            mock_client.post.side_effect = respond
+            try:
+                with pytest.raises(KeyboardInterrupt):
+                    classify_jobs_batch(
+                        jobs=jobs,
+                        categories=["Good Match", "Poor Match"],
+                        api_key="key",
+                        model="m",
+                        batch_size=1,
+                        session=session,
+                    )
+                assert len(finished) == 1
+            finally:
+                release.set()
+
+    def test_duplicate_texts_keep_alignment(self):
+        """Test duplicate job texts are sent once and results map back to every job"""
+        from src.classifier import classify_jobs_batch
+
+        jobs = [
+            {"refnr": "1", "text": "Repost"},
+            {"refnr": "2", "text": "Other"},
+            {"refnr": "3", "text": "Repost"},
+        ]
+
+        with patch("src.classifier.default_http_client") as mock_client:
+            mock_client.post.return_value = self._llm_response(
+                "[001] - Good Match\n[002] - Poor Match"
+            )
+            result = classify_jobs_batch(
+                jobs=jobs,
+                categories=["Good Match", "Poor Match"],
+                api_key="key",
+                model="m",
+            )
+
+        assert mock_client.post.call_count == 1
+        assert [job["refnr"] for job in result] == ["1", "2", "3"]
+        assert [job["categories"] for job in result] == [
+            ["Good Match"],
+            ["Poor Match"],
+            ["Good Match"],
+        ]
+
+
+class TestClassificationCacheErrors:
+    """Test the persistent classification cache never returns stale results"""
+
+    def test_cache_is_keyed_by_profile(self, tmp_path):
+        """Test cached results are reused only when the classification context matches"""
+        from src.classifier import classify_jobs_batch
+        from src.config import Config
+        from src.llm.result_cache import ClassificationCache
+
+        cache = ClassificationCache(tmp_path / "cache.sqlite")
+        jobs = [{"refnr": "1", "titel": "A", "text": "Same text"}]
+        categories = ["Good Match", "Poor Match"]
+
+        def classify(cv, content, temperature=0.2):
+            config_obj = Config()
+            config_obj.set("llm.inference.temperature", temperature)
+            with patch("src.classifier.default_http_client") as mock_client:
+                mock_client.post.return_value = TestClassifierErrors._llm_response(content)
+                result = classify_jobs_batch(
+                    jobs=jobs,
+                    categories=categories,
+                    api_key="key",
+                    model="m",
+                    category_definitions={"Good Match": cv},
+                    config_obj=config_obj,
+                    result_cache=cache,
+                )
+                return result, mock_client.post.call_count
+
+        first, calls = classify("CV one", "[001] - Good Match")
+        assert first[0]["categories"] == ["Good Match"] and calls == 1
+
+        # Same inputs: served from cache without an API call
+        cached, calls = classify("CV one", "[001] - Poor Match")
+        assert cached[0]["categories"] == ["Good Match"] and calls == 0
+
+        # Updated CV: must be classified again
+        updated, calls = classify("CV two", "[001] - Poor Match")
+        assert updated[0]["categories"] == ["Poor Match"] and calls == 1
+
+        # Different sampling temperature: must be classified again
+        resampled, calls = classify("CV two", "[001] - Good Match", temperature=0.9)
+        assert resampled[0]["categories"] == ["Good Match"] and calls == 1
+
+    def test_finished_batches_are_cached_when_a_batch_fails(self, tmp_path):
+        """Test results of successful batches survive a failure in another batch"""
+        from src.classifier import classify_jobs_batch
+        from src.exceptions import LLMDataIntegrityError
+        from src.llm.result_cache import ClassificationCache
+
+        cache = ClassificationCache(tmp_path / "cache.sqlite")
+        jobs = [{"refnr": str(i), "titel": f"Job {i}", "text": f"Text {i}"} for i in range(2)]
+
+        def classify(bad_text):
+            def respond(url, headers=None, data=None, **kwargs):
+                prompt = json.loads(data)["messages"][0]["content"]
+                category = "Made Up" if bad_text in prompt else "Good Match"
+                return TestClassifierErrors._llm_response(f"[001] - {category}")
+
+            with patch("src.classifier.default_http_client") as mock_client:
+                mock_client.post.side_effect = respond
+                result = classify_jobs_batch(
+                    jobs=jobs,
+                    categories=["Good Match", "Poor Match"],
+                    api_key="key",
+                    model="m",
+                    batch_size=1,
+                    result_cache=cache,
+                )
+                return result, mock_client.post.call_count
+
+        with pytest.raises(LLMDataIntegrityError):
+            classify("Text 1")
+
+        # Only the job of the failed batch is sent again
+        result, calls = classify("no failure")
+        assert calls == 1
+        assert [job["categories"] for job in result] == [["Good Match"], ["Good Match"]]
+
 
 class TestScraperErrors:
     """Test scraper error handling"""
@@ -126,13 +417,47 @@ class TestHTTPClientErrors:
         """Test timeout parameter is respected"""
         from src.http_client import HttpClient
 
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_get.side_effect = TimeoutError("Timeout")
 
             client = HttpClient()
             with pytest.raises(TimeoutError):
                 client.get("https://example.com", timeout=1)
 
+        assert mock_get.call_args.kwargs["timeout"] == 1
+
+    def test_cookies_not_carried_to_later_requests(self):
+        """Test a cookie set by one response is not sent with the next request"""
+        from email.message import Message
+        from types import SimpleNamespace
+
+        import requests
+
+        from src.http_client import HttpClient
+
+        sent = []
+
+        def fake_send(adapter, request, **kwargs):
+            sent.append(request)
+            headers = Message()
+            headers["Set-Cookie"] = "consent=1; Path=/"
+            response = requests.Response()
+            response.status_code = 200
+            response.url = request.url
+            response.request = request
+            response._content = b""
+            # requests reads Set-Cookie from the underlying http.client response
+            response.raw = SimpleNamespace(_original_response=SimpleNamespace(msg=headers))
+            return response
+
+        client = HttpClient()
+        with patch("requests.adapters.HTTPAdapter.send", fake_send):
+            client.get("https://example.com/a")
+            client.get("https://example.com/b")
+
+        assert "Cookie" not in sent[1].headers
+        assert len(client.session.cookies) == 0
+
 
 class TestConfigErrors:
     """Test configuration error handling"""
@@ -147,6 +472,37 @@ class TestConfigErrors:
         result = config.get("nonexistent.deeply.nested.key", default={})
         assert result == {}
 
+    def test_cached_lookups_never_go_stale(self):
+        """Test cached config lookups follow set() and reload() and keep None apart from missing"""
+        from src.config import Config
+        from src.exceptions import ConfigurationError
+
+        config = Config({"llm": {"inference": {"temperature": 0.2, "top_p": None}}})
+
+        # set() after a cached get()
+        assert config.get("llm.inference.temperature") == 0.2
+        config.set("llm.inference.temperature", 0.9)
+        assert config.get("llm.inference.temperature") == 0.9
+
+        # A key set to None is found, a missing key falls back to the default
+        assert config.get("llm.inference.top_p", "default") is None
+        assert config.get_required("llm.inference.top_p") is None
+        assert config.get("llm.inference.seed", "default") == "default"
+
+        # get_required() still raises after the miss was cached, and sees a later set()
+        with pytest.raises(ConfigurationError):
+            config.get_required("llm.inference.seed")
+        config.set("llm.inference.seed", 42)
+        assert config.get_required("llm.inference.seed") == 42
+
+        # reload() drops both runtime overrides and cached lookups
+        file_config = Config()
+        file_temperature = file_config.get_required("llm.inference.temperature")
+        file_config.set("llm.inference.temperature", file_temperature + 1)
+        assert file_config.get("llm.inference.temperature") == file_temperature + 1
+        file_config.reload()
+        assert file_config.get("llm.inference.temperature") == file_temperature
+
 
 class TestCLIErrors:
     """Test CLI validation errors"""